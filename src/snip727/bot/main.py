@@ -1,5 +1,7 @@
 """Telegram bot main module."""
 import asyncio
+import logging
+import sys
 import structlog
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
@@ -190,7 +192,12 @@ async def handle_alert(alert_data: dict) -> None:
 def main() -> None:
     """Start the bot."""
     settings = get_settings()
+    # Unknown names fall back to INFO instead of failing at startup
+    log_level = logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO)
 
+    logging.basicConfig(format="%(message)s", level=log_level)
+    # httpx logs every request URL at INFO, and Telegram API URLs embed the bot token
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -204,6 +211,8 @@ def main() -> None:
             structlog.processors.JSONRenderer(),
         ],
         context_class=dict,
+        # Calls below log_level return immediately, before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -228,6 +237,11 @@ def main() -> None:
 
     async def run_bot() -> None:
         """Run bot with monitoring."""
+        # Let new tasks run inline until they first suspend (Python 3.12+);
+        # the monitor gathers many short coroutines per cycle
+        if sys.version_info >= (3, 12):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
         # Start monitoring
         asyncio.create_task(start_monitoring())
         
@@ -1,4 +1,6 @@
 """Application configuration using Pydantic Settings."""
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,12 +19,25 @@ class Settings(BaseSettings):
 
     # Web3 settings
     web3_provider_url: str = "http://localhost:8545"
+    web3_ws_url: str = ""  # Enables eth_subscribe push delivery; defaults to web3_provider_url if that is ws(s)://
     chain_id: int = 1
 
+    # Uniswap settings
+    uniswap_v2_factory: str = "0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"
+    uniswap_v3_factory: str = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
+
+    # Monitoring settings
+    min_liquidity_usd: float = 10000.0
+    whale_threshold_usd: float = 50000.0
+    sentiment_threshold: float = 0.5
+    log_batch_size: int = 500  # Pool addresses per get_logs request
+    rpc_parallelism: int = 16  # Concurrent get_logs requests per cycle
+
     # Logging
     log_level: str = "INFO"
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings, parsed once per process."""
     return Settings()
@@ -1,13 +1,15 @@
 """Offline ruBERT sentiment analysis service."""
 import asyncio
 import structlog
-from typing import Dict, Optional
-import torch
+from typing import Dict, List, Optional
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import threading
 
 logger = structlog.get_logger()
 
+# Model classes: 0=negative, 1=neutral, 2=positive
+CLASS_SENTIMENT = {0: -1, 1: 0, 2: 1}
+
 
 class SentimentAnalyzer:
     """Offline sentiment analysis using ruBERT model."""
@@ -16,7 +18,7 @@ class SentimentAnalyzer:
         self.model_name = "cointegrated/rubert-base-cased-sentence-sentiment"
         self.tokenizer = None
         self.model = None
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.device = None  # Chosen when the model loads; torch is imported lazily
         self._initialized = False
         self._lock = threading.Lock()
     
@@ -30,7 +32,10 @@ class SentimentAnalyzer:
                 return
             
             try:
+                import torch
+                
                 logger.info("initializing_sentiment_model", model=self.model_name)
+                self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
                 self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
                 self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
                 self.model.to(self.device)
@@ -65,12 +70,46 @@ class SentimentAnalyzer:
             logger.error("sentiment_analysis_failed", text=text[:100], error=str(e))
             return 0
     
+    async def analyze_sentiment_batch(self, texts: List[str]) -> List[int]:
+        """Analyze sentiment of several texts with a single model pass.
+        
+        Returns:
+            -1, 0 or +1 per text, in input order
+        """
+        results = [0] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return results
+        
+        # Initialize model if not done
+        if not self._initialized:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._initialize_model)
+        
+        try:
+            # Run inference in thread pool
+            loop = asyncio.get_event_loop()
+            batch = await loop.run_in_executor(None, self._analyze_batch_sync, [texts[i] for i in indices])
+        except Exception as e:
+            logger.error("batch_sentiment_analysis_failed", count=len(indices), error=str(e))
+            return results
+        
+        for i, sentiment in zip(indices, batch):
+            results[i] = sentiment
+        return results
+    
     def _analyze_sync(self, text: str) -> int:
         """Synchronous sentiment analysis."""
+        return self._analyze_batch_sync([text])[0]
+    
+    def _analyze_batch_sync(self, texts: List[str]) -> List[int]:
+        """Synchronous sentiment analysis of a padded batch."""
         try:
-            # Tokenize text
+            import torch  # Already loaded by _initialize_model
+            
+            # Tokenize texts
             inputs = self.tokenizer(
-                text,
+                texts,
                 return_tensors="pt",
                 truncation=True,
                 max_length=512,
@@ -78,24 +117,17 @@ class SentimentAnalyzer:
             )
             inputs = {k: v.to(self.device) for k, v in inputs.items()}
             
-            # Get predictions
+            # Get predictions; softmax is monotonic, so argmax of the logits is the predicted class
             with torch.no_grad():
                 outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                predicted_class = torch.argmax(predictions, dim=-1).item()
+                predicted_classes = torch.argmax(outputs.logits, dim=-1).tolist()
             
-            # Convert to sentiment score
-            # Model classes: 0=negative, 1=neutral, 2=positive
-            if predicted_class == 0:
-                return -1
-            elif predicted_class == 2:
-                return 1
-            else:
-                return 0
+            # Convert to sentiment scores
+            return [CLASS_SENTIMENT.get(predicted_class, 0) for predicted_class in predicted_classes]
                 
         except Exception as e:
             logger.error("sync_sentiment_analysis_failed", error=str(e))
-            return 0
+            return [0] * len(texts)
     
     async def analyze_crypto_sentiment(self, token_symbol: str, events: list) -> Dict[str, any]:
         """Analyze sentiment for crypto-related events."""
@@ -117,11 +149,8 @@ class SentimentAnalyzer:
         if not sentiment_texts:
             return {"sentiment": 0, "confidence": 0.0, "texts": []}
         
-        # Analyze each text
-        sentiments = []
-        for text in sentiment_texts:
-            sentiment = await self.analyze_sentiment(text)
-            sentiments.append(sentiment)
+        # Analyze all texts in one batch
+        sentiments = await self.analyze_sentiment_batch(sentiment_texts)
         
         # Calculate overall sentiment
         positive_count = sentiments.count(1)
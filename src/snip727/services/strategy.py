@@ -1,7 +1,9 @@
 """N-of-4 voting strategy for signal generation."""
 import asyncio
 import structlog
-from typing import Dict, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Set
 from datetime import datetime, timedelta
 
 from snip727.core.config import get_settings
@@ -10,23 +12,19 @@ from snip727.web3.monitor import PoolEvent
 
 logger = structlog.get_logger()
 
+# Signals kept in memory; the oldest are dropped first
+MAX_SIGNAL_HISTORY = 10_000
 
+
+@dataclass(slots=True, eq=False)
 class Signal:
     """Represents a trading signal."""
     
-    def __init__(
-        self,
-        signal_type: str,
-        pool_address: str,
-        confidence: float,
-        data: Dict[str, any],
-        timestamp: datetime,
-    ):
-        self.signal_type = signal_type
-        self.pool_address = pool_address
-        self.confidence = confidence
-        self.data = data
-        self.timestamp = timestamp
+    signal_type: str
+    pool_address: str
+    confidence: float
+    data: Dict[str, any]
+    timestamp: datetime
 
 
 class Nof4Strategy:
@@ -35,8 +33,8 @@ class Nof4Strategy:
     def __init__(self):
         self.settings = get_settings()
         self.sentiment_analyzer = get_sentiment_analyzer()
-        self.signals: List[Signal] = []
-        self.event_history: Dict[str, List[PoolEvent]] = {}
+        self.signals: Deque[Signal] = deque(maxlen=MAX_SIGNAL_HISTORY)  # Oldest first
+        self.event_history: Dict[str, Deque[PoolEvent]] = {}
         self.alert_callbacks: List[callable] = []
     
     def add_alert_callback(self, callback: callable) -> None:
@@ -46,17 +44,14 @@ class Nof4Strategy:
     async def process_event(self, event: PoolEvent) -> None:
         """Process a pool event and potentially generate signals."""
         # Store event in history
-        if event.pool_address not in self.event_history:
-            self.event_history[event.pool_address] = []
-        
-        self.event_history[event.pool_address].append(event)
+        history = self.event_history.setdefault(event.pool_address, deque())
+        history.append(event)
         
-        # Keep only recent events (last hour)
+        # Keep only recent events (last hour); events arrive in block order,
+        # so expired ones are always at the front
         cutoff_time = datetime.now() - timedelta(hours=1)
-        self.event_history[event.pool_address] = [
-            e for e in self.event_history[event.pool_address]
-            if datetime.fromtimestamp(e.block_number * 12) > cutoff_time  # ~12s per block
-        ]
+        while history and self._event_time(history[0]) <= cutoff_time:
+            history.popleft()
         
         # Generate signals based on event
         await self._generate_signals(event)
@@ -64,6 +59,13 @@ class Nof4Strategy:
         # Check if we have enough signals for an alert
         await self._check_for_alerts(event.pool_address)
     
+    @staticmethod
+    def _event_time(event: PoolEvent) -> datetime:
+        """Get event block time, estimating it from the block number when unknown."""
+        if event.timestamp is not None:
+            return event.timestamp
+        return datetime.fromtimestamp(event.block_number * 12)  # ~12s per block
+    
     async def _generate_signals(self, event: PoolEvent) -> None:
         """Generate signals based on event type."""
         timestamp = datetime.now()
@@ -114,10 +116,7 @@ class Nof4Strategy:
         """Check if we have enough signals for an alert (N-of-4 voting)."""
         # Get recent signals for this pool (last 30 minutes)
         cutoff_time = datetime.now() - timedelta(minutes=30)
-        recent_signals = [
-            s for s in self.signals
-            if s.pool_address == pool_address and s.timestamp > cutoff_time
-        ]
+        recent_signals = [s for s in self._signals_since(cutoff_time) if s.pool_address == pool_address]
         
         if len(recent_signals) < 3:  # Need at least 3 signals for N-of-4
             return
@@ -130,7 +129,7 @@ class Nof4Strategy:
         for signal_type, count in type_counts.items():
             if count >= 3:
                 # Generate sentiment analysis
-                events = self.event_history.get(pool_address, [])
+                events = list(self.event_history.get(pool_address, ()))
                 sentiment_result = await self.sentiment_analyzer.analyze_crypto_sentiment(
                     "TOKEN", events  # We'll use generic token name for now
                 )
@@ -179,20 +178,34 @@ class Nof4Strategy:
                     )
                     
                     # Clear old signals for this pool to avoid spam
-                    self.signals = [s for s in self.signals if s.pool_address != pool_address]
+                    self.signals = deque(
+                        (s for s in self.signals if s.pool_address != pool_address),
+                        maxlen=MAX_SIGNAL_HISTORY,
+                    )
                     break
     
+    def _signals_since(self, cutoff_time: datetime) -> Iterator[Signal]:
+        """Yield signals newer than cutoff_time, newest first.
+
+        Signals are appended in time order, so the walk stops at the first
+        older one instead of scanning the whole history.
+        """
+        for signal in reversed(self.signals):
+            if signal.timestamp <= cutoff_time:
+                return
+            yield signal
+    
     def get_recent_signals(self, pool_address: Optional[str] = None, limit: int = 50) -> List[Dict[str, any]]:
         """Get recent signals."""
         cutoff_time = datetime.now() - timedelta(hours=24)
-        recent_signals = [
-            s for s in self.signals
-            if s.timestamp > cutoff_time and (pool_address is None or s.pool_address == pool_address)
-        ]
         
-        # Sort by timestamp (newest first) and limit
-        recent_signals.sort(key=lambda x: x.timestamp, reverse=True)
-        recent_signals = recent_signals[:limit]
+        # Newest first, stopping once the limit is reached
+        recent_signals = []
+        for s in self._signals_since(cutoff_time):
+            if pool_address is None or s.pool_address == pool_address:
+                recent_signals.append(s)
+                if len(recent_signals) >= limit:
+                    break
         
         return [
             {
@@ -217,7 +230,7 @@ class Nof4Strategy:
         
         # Recent activity (last hour)
         cutoff_time = datetime.now() - timedelta(hours=1)
-        recent_signals = [s for s in self.signals if s.timestamp > cutoff_time]
+        recent_signals = list(self._signals_since(cutoff_time))
         
         return {
             "monitored_pools": total_pools,
@@ -1,12 +1,15 @@
 """Async Web3 client with Redis caching and free RPC support."""
 import asyncio
-import json
+import time
 import structlog
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 import aiohttp
+import orjson
 import redis.asyncio as redis
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3.providers.async_rpc import AsyncHTTPProvider
+from web3.providers.websocket import WebsocketProviderV2
+from web3.types import RPCResponse
 
 from snip727.core.config import get_settings
 
@@ -17,11 +20,41 @@ FREE_RPC_URLS = [
     "https://ethereum.publicnode.com",
     "https://rpc.ankr.com/eth",
     "https://eth.llamarpc.com",
-    "https://ethereum.publicnode.com",
     "https://rpc.flashbots.net",
     "https://mainnet.eth.cloud.ava.do",
 ]
 
+# How long a fetched block number is reused before asking the node again (seconds)
+BLOCK_NUMBER_TTL = 2.0
+
+
+class OrjsonHTTPProvider(AsyncHTTPProvider):
+    """HTTP provider that posts through a given session and parses responses with orjson.
+
+    eth_getLogs responses can hold thousands of entries; orjson decodes them
+    several times faster than the stdlib json used by web3.py. Requests skip
+    web3's per-URI session cache, which would keep serving its own session
+    once a URI has been used before.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        session: aiohttp.ClientSession,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self.session = session
+
+    async def make_request(self, method: str, params: Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        async with self.session.post(self.endpoint_uri, data=request_data, **self.get_request_kwargs()) as response:
+            raw_response = await response.read()
+        return self.decode_rpc_response(raw_response)
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        return orjson.loads(raw_response)
+
 
 class AsyncWeb3Client:
     """Async Web3 client with failover and Redis caching."""
@@ -33,7 +66,15 @@ class AsyncWeb3Client:
         self.w3: Optional[Web3] = None
         self.redis_client: Optional[redis.Redis] = None
         self.session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None  # Outlives sessions replaced on failover
         self._lock = asyncio.Lock()
+        self._generation = 0  # Bumped on every failover, so concurrent failures fail over once
+        self._latest_block: Optional[int] = None
+        self._latest_block_ts = 0.0
+        # Push delivery endpoint; a ws(s):// provider URL doubles as one
+        self.ws_url = self.settings.web3_ws_url
+        if not self.ws_url and self.settings.web3_provider_url.startswith(("ws://", "wss://")):
+            self.ws_url = self.settings.web3_provider_url
 
     async def initialize(self) -> None:
         """Initialize Web3 client and Redis connection."""
@@ -55,8 +96,14 @@ class AsyncWeb3Client:
         for i in range(len(self.rpc_urls)):
             rpc_url = self.rpc_urls[self.current_rpc_index]
             try:
-                self.session = aiohttp.ClientSession()
-                provider = AsyncHTTPProvider(rpc_url, request_kwargs={'timeout': 30})
+                # Pooled keep-alive connections so each RPC call skips the TCP/TLS handshake;
+                # the connector (and its DNS cache) is shared by every session of this client
+                if self._connector is None or self._connector.closed:
+                    self._connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=75)
+                self.session = aiohttp.ClientSession(
+                    connector=self._connector, connector_owner=False, raise_for_status=True
+                )
+                provider = OrjsonHTTPProvider(rpc_url, self.session, request_kwargs={'timeout': 30})
                 self.w3 = Web3(provider, modules={'eth': []}, middlewares=[])
                 
                 # Test connection
@@ -78,7 +125,7 @@ class AsyncWeb3Client:
         try:
             data = await self.redis_client.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning("redis_cache_get_failed", key=key, error=str(e))
         return None
@@ -88,27 +135,28 @@ class AsyncWeb3Client:
         if not self.redis_client:
             return
         try:
-            await self.redis_client.setex(key, ttl, json.dumps(data))
+            await self.redis_client.setex(key, ttl, orjson.dumps(data))
         except Exception as e:
             logger.warning("redis_cache_set_failed", key=key, error=str(e))
 
     async def get_block_number(self) -> int:
-        """Get current block number with caching."""
-        cache_key = "block_number"
-        cached = await self.get_cached_data(cache_key)
-        if cached:
-            return cached
+        """Get current block number, reusing a recent result in-process."""
+        now = time.monotonic()
+        if self._latest_block is not None and now - self._latest_block_ts < BLOCK_NUMBER_TTL:
+            return self._latest_block
 
         if not self.w3:
             raise Exception("Web3 not initialized")
 
+        generation = self._generation
         try:
             block_number = await self.w3.eth.block_number
-            await self.set_cached_data(cache_key, block_number, ttl=10)
+            self._latest_block = block_number
+            self._latest_block_ts = now
             return block_number
         except Exception as e:
             logger.error("get_block_number_failed", error=str(e))
-            await self._try_failover()
+            await self._try_failover(generation)
             raise
 
     async def get_logs(self, **kwargs: Any) -> List[Dict[str, Any]]:
@@ -121,13 +169,31 @@ class AsyncWeb3Client:
         if not self.w3:
             raise Exception("Web3 not initialized")
 
+        generation = self._generation
         try:
             logs = await self.w3.eth.get_logs(**kwargs)
             await self.set_cached_data(cache_key, logs, ttl=60)
             return logs
         except Exception as e:
             logger.error("get_logs_failed", error=str(e))
-            await self._try_failover()
+            await self._try_failover(generation)
+            raise
+
+    async def get_block(self, block_identifier: Any, full_transactions: bool = False) -> Dict[str, Any]:
+        """Get block by number or tag.
+
+        Transactions are returned as raw hashes (or objects when
+        ``full_transactions`` is set); callers convert to hex only if needed.
+        """
+        if not self.w3:
+            raise Exception("Web3 not initialized")
+
+        generation = self._generation
+        try:
+            return await self.w3.eth.get_block(block_identifier, full_transactions=full_transactions)
+        except Exception as e:
+            logger.error("get_block_failed", block=str(block_identifier), error=str(e))
+            await self._try_failover(generation)
             raise
 
     async def get_transaction_receipt(self, tx_hash: str) -> Dict[str, Any]:
@@ -135,17 +201,52 @@ class AsyncWeb3Client:
         if not self.w3:
             raise Exception("Web3 not initialized")
 
+        generation = self._generation
         try:
             receipt = await self.w3.eth.get_transaction_receipt(tx_hash)
             return receipt
         except Exception as e:
             logger.error("get_transaction_receipt_failed", tx_hash=tx_hash, error=str(e))
-            await self._try_failover()
+            await self._try_failover(generation)
             raise
 
-    async def _try_failover(self) -> None:
-        """Try to failover to next RPC endpoint."""
+    async def subscribe(
+        self,
+        subscription_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        on_subscribed: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> AsyncIterator[Any]:
+        """Yield results pushed by the node for an eth_subscribe subscription.
+
+        Requires ``web3_ws_url`` or a ws(s):// ``web3_provider_url``; the free
+        HTTP endpoints cannot push. ``on_subscribed`` is awaited once the
+        subscription is active, before any result is yielded.
+        """
+        if not self.ws_url:
+            raise Exception("WebSocket provider URL not configured")
+
+        async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.ws_url)) as w3:
+            if params is None:
+                await w3.eth.subscribe(subscription_type)
+            else:
+                await w3.eth.subscribe(subscription_type, params)
+            logger.info("web3_subscribed", subscription_type=subscription_type)
+            if on_subscribed is not None:
+                await on_subscribed()
+
+            async for response in w3.ws.process_subscriptions():
+                yield response["result"]
+
+    async def _try_failover(self, generation: int) -> None:
+        """Try to failover to next RPC endpoint.
+
+        Skipped if another failed call already failed over since ``generation``
+        was read, so concurrent failures move on by one endpoint only.
+        """
         async with self._lock:
+            if generation != self._generation:
+                return
+            self._generation += 1
             logger.info("attempting_failover")
             if self.session:
                 await self.session.close()
@@ -156,6 +257,8 @@ class AsyncWeb3Client:
         """Close connections."""
         if self.session:
             await self.session.close()
+        if self._connector:
+            await self._connector.close()
         if self.redis_client:
             await self.redis_client.close()
 
@@ -1,10 +1,15 @@
 """Uniswap V2/V3 pool monitoring with event subscription."""
 import asyncio
 import structlog
-from typing import Callable, Dict, List, Optional, Set
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from web3 import Web3
 from web3.contract import Contract
 from web3.datastructures import AttributeDict
+from hexbytes import HexBytes
 
 from snip727.core.config import get_settings
 from snip727.web3.client import get_web3_client
@@ -26,7 +31,7 @@ UNISWAP_V2_FACTORY_ABI = [
     }
 ]
 
-# Uniswap V2 Pair ABI (minimal)
+# Uniswap V2 Pair ABI (minimal); Mint/Swap logs are decoded by hand from this layout
 UNISWAP_V2_PAIR_ABI = [
     {
         "anonymous": False,
@@ -69,27 +74,68 @@ UNISWAP_V3_FACTORY_ABI = [
     }
 ]
 
+# Event topic hashes (topic0); fixed by the ABI, so computed once at import
+PAIR_CREATED_TOPIC0 = Web3.keccak(text="PairCreated(address,address,address,uint256)")
+POOL_CREATED_TOPIC0 = Web3.keccak(text="PoolCreated(address,address,uint24,int24,address)")
+MINT_TOPIC0 = Web3.keccak(text="Mint(address,uint256,uint256)")
+SWAP_TOPIC0 = Web3.keccak(text="Swap(address,address,uint256,uint256,uint256,uint256)")
 
+# get_logs topic filters (topic0 OR-lists)
+FACTORY_TOPICS = [[PAIR_CREATED_TOPIC0.hex(), POOL_CREATED_TOPIC0.hex()]]
+POOL_TOPICS = [[MINT_TOPIC0.hex(), SWAP_TOPIC0.hex()]]
+
+
+def bloom_mask(value: bytes) -> int:
+    """Get the logsBloom bits set by an address or topic (3 of 2048, per the yellow paper)."""
+    digest = Web3.keccak(value)
+    mask = 0
+    for i in (0, 2, 4):
+        mask |= 1 << (((digest[i] << 8) | digest[i + 1]) & 2047)
+    return mask
+
+
+@lru_cache(maxsize=100_000)
+def checksum_address(value: bytes) -> str:
+    """Get the checksummed form of a raw 20-byte address.
+
+    Cached because swap senders are mostly a handful of routers, and each
+    checksum costs a keccak.
+    """
+    return Web3.to_checksum_address(value)
+
+
+MINT_BLOOM_MASK = bloom_mask(MINT_TOPIC0)
+SWAP_BLOOM_MASK = bloom_mask(SWAP_TOPIC0)
+
+# Number of block timestamps kept for stamping events
+BLOCK_TS_CACHE_SIZE = 4096
+
+# Number of recently handled pool log identities kept for deduplication
+SEEN_LOGS_CACHE_SIZE = 65536
+
+# Blocks re-read on every poll, in case the previous answer came from a lagging endpoint
+POLL_OVERLAP_BLOCKS = 5
+
+# Largest block range requested by a single poll
+MAX_POLL_BLOCKS = 500
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class PoolEvent:
-    """Represents a pool-related event."""
+    """Represents a pool-related event.
+
+    Fields cannot be reassigned, but ``data`` is a plain dict that consumers
+    must not mutate; equality and hashing stay identity-based.
+    """
     
-    def __init__(
-        self,
-        event_type: str,
-        pool_address: str,
-        token0: str,
-        token1: str,
-        data: Dict[str, any],
-        block_number: int,
-        transaction_hash: str,
-    ):
-        self.event_type = event_type
-        self.pool_address = pool_address
-        self.token0 = token0
-        self.token1 = token1
-        self.data = data
-        self.block_number = block_number
-        self.transaction_hash = transaction_hash
+    event_type: str
+    pool_address: str
+    token0: str
+    token1: str
+    data: Dict[str, any]
+    block_number: int
+    transaction_hash: str
+    timestamp: Optional[datetime] = None  # Block time, when known
 
 
 class UniswapMonitor:
@@ -102,8 +148,33 @@ class UniswapMonitor:
         self.w3 = None
         self.v2_factory = None
         self.v3_factory = None
-        self.monitored_pools: Set[str] = set()
+        self._pair_created_event = None
+        self._pool_created_event = None
+        # Monitored pools: raw 20-byte addresses for membership checks, plus per-pool lists for polling
+        self.monitored_pools: Set[bytes] = set()
+        self._pool_addresses: List[str] = []  # Hex addresses, ready for get_logs payloads
+        self._pool_blooms: List[int] = []  # logsBloom bits per monitored pool
         self.running = False
+        self._rpc_semaphore = asyncio.Semaphore(self.settings.rpc_parallelism)
+        self._block_ts_cache: Dict[int, int] = {}
+        self._cursor: Dict[str, int] = {"factories": 0, "pools": 0}  # Last block polled per filter
+        self._seen_logs: "OrderedDict[bytes, None]" = OrderedDict()  # (tx hash, log index) LRU
+        self._pending_blocks: Set[int] = set()  # Blocks still to be (re-)read in subscription mode
+        self._last_head = 0  # Highest head pushed by the node, to spot heads missed while disconnected
+        
+        # Thresholds in raw 18-decimal units, compared before anything is decoded or allocated
+        self._min_liquidity_wei = int(self.settings.min_liquidity_usd * 10**18)
+        self._whale_threshold_wei = int(self.settings.whale_threshold_usd * 10**18)
+        
+        # Log handlers keyed by raw topic0
+        self._factory_handlers: Dict[bytes, Callable[[Dict[str, any]], Awaitable[None]]] = {
+            PAIR_CREATED_TOPIC0: self._handle_v2_pair_created,
+            POOL_CREATED_TOPIC0: self._handle_v3_pool_created,
+        }
+        self._pool_handlers: Dict[bytes, Callable[[str, Dict[str, any]], Awaitable[None]]] = {
+            MINT_TOPIC0: self._handle_mint_event,
+            SWAP_TOPIC0: self._handle_swap_event,
+        }
         
     async def initialize(self) -> None:
         """Initialize monitor and contracts."""
@@ -121,6 +192,10 @@ class UniswapMonitor:
             abi=UNISWAP_V3_FACTORY_ABI
         )
         
+        # Event decoders are reused for every log
+        self._pair_created_event = self.v2_factory.events.PairCreated()
+        self._pool_created_event = self.v3_factory.events.PoolCreated()
+        
         logger.info("monitor_initialized")
     
     async def start(self) -> None:
@@ -131,12 +206,26 @@ class UniswapMonitor:
         self.running = True
         logger.info("monitor_starting")
         
-        # Start monitoring tasks
-        tasks = [
-            self._monitor_v2_pairs(),
-            self._monitor_v3_pairs(),
-            self._monitor_existing_pools(),
-        ]
+        # Start monitoring tasks; with WebSocket, factory events and new heads are pushed by the node
+        if self.client.ws_url:
+            tasks = [
+                self._subscribe(
+                    "factories",
+                    "logs",
+                    {
+                        "address": [self.settings.uniswap_v2_factory, self.settings.uniswap_v3_factory],
+                        "topics": FACTORY_TOPICS,
+                    },
+                    self._handle_pushed_factory_event,
+                    on_subscribed=self._catch_up_factories,
+                ),
+                self._subscribe("new_heads", "newHeads", None, self._handle_new_head),
+            ]
+        else:
+            tasks = [
+                self._monitor_factories(),
+                self._monitor_existing_pools(),
+            ]
         
         await asyncio.gather(*tasks)
     
@@ -145,58 +234,74 @@ class UniswapMonitor:
         self.running = False
         logger.info("monitor_stopped")
     
-    async def _monitor_v2_pairs(self) -> None:
-        """Monitor new V2 pairs."""
+    async def _subscribe(
+        self,
+        name: str,
+        subscription_type: str,
+        params: Optional[Dict[str, any]],
+        handler: Callable[[Dict[str, any]], Awaitable[None]],
+        on_subscribed: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """Receive results pushed by the node via eth_subscribe, resubscribing on errors.
+
+        ``on_subscribed`` runs each time the subscription is (re)established,
+        to catch up on what was missed while it was down.
+        """
         while self.running:
             try:
-                latest_block = await self.client.get_block_number()
-                from_block = latest_block - 100  # Look back 100 blocks
-                
-                # Get PairCreated events
-                events = await self.client.get_logs(
-                    address=self.settings.uniswap_v2_factory,
-                    topics=[
-                        self.w3.keccak(text="PairCreated(address,address,address,uint256)").hex()
-                    ],
-                    fromBlock=from_block,
-                    toBlock="latest"
-                )
-                
-                for event in events:
-                    await self._handle_v2_pair_created(event)
-                
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
+                async for result in self.client.subscribe(subscription_type, params, on_subscribed=on_subscribed):
+                    if not self.running:
+                        break
+                    await handler(result)
+
             except Exception as e:
-                logger.error("v2_monitor_error", error=str(e))
+                logger.error("subscription_error", subscription=name, error=str(e))
                 await asyncio.sleep(60)
-    
-    async def _monitor_v3_pairs(self) -> None:
-        """Monitor new V3 pools."""
+
+    async def _monitor_factories(self) -> None:
+        """Monitor new V2 pairs and V3 pools."""
         while self.running:
             try:
                 latest_block = await self.client.get_block_number()
-                from_block = latest_block - 100
-                
-                # Get PoolCreated events
-                events = await self.client.get_logs(
-                    address=self.settings.uniswap_v3_factory,
-                    topics=[
-                        self.w3.keccak(text="PoolCreated(address,address,uint24,int24,address)").hex()
-                    ],
-                    fromBlock=from_block,
-                    toBlock="latest"
-                )
+                # Look back 100 blocks on the first pass
+                from_block, to_block = self._poll_range("factories", latest_block, 100)
                 
-                for event in events:
-                    await self._handle_v3_pool_created(event)
+                if from_block <= to_block:
+                    await self._read_factory_logs(from_block, to_block)
                 
-                await asyncio.sleep(30)
+                await asyncio.sleep(30)  # Check every 30 seconds
                 
             except Exception as e:
-                logger.error("v3_monitor_error", error=str(e))
+                logger.error("factory_monitor_error", error=str(e))
                 await asyncio.sleep(60)
     
+    async def _catch_up_factories(self) -> None:
+        """Read factory logs over HTTP up to the current block.
+
+        Runs whenever the factory subscription is (re)established, so pools
+        created while it was down are still picked up.
+        """
+        latest_block = await self.client.get_block_number()
+        while self._cursor["factories"] < latest_block:
+            # Look back 100 blocks on the first pass
+            from_block, to_block = self._poll_range("factories", latest_block, 100)
+            await self._read_factory_logs(from_block, to_block)
+    
+    async def _read_factory_logs(self, from_block: int, to_block: int) -> None:
+        """Fetch and handle factory logs in a block range, then move the factories cursor past it."""
+        # PairCreated and PoolCreated events from both factories in one request
+        events = await self.client.get_logs(
+            address=[self.settings.uniswap_v2_factory, self.settings.uniswap_v3_factory],
+            topics=FACTORY_TOPICS,
+            fromBlock=from_block,
+            toBlock=to_block
+        )
+        
+        for event in events:
+            await self._handle_factory_event(event)
+        
+        self._cursor["factories"] = to_block
+    
     async def _monitor_existing_pools(self) -> None:
         """Monitor trading activity on existing pools."""
         while self.running:
@@ -206,39 +311,18 @@ class UniswapMonitor:
                     continue
                 
                 latest_block = await self.client.get_block_number()
-                from_block = latest_block - 50  # Look back 50 blocks
+                # Look back 50 blocks on the first pass
+                from_block, to_block = self._poll_range("pools", latest_block, 50)
+                pool_count = len(self._pool_addresses)
                 
-                # Monitor Mint and Swap events for all pools
-                for pool_address in list(self.monitored_pools):
-                    try:
-                        # Mint events (liquidity additions)
-                        mint_events = await self.client.get_logs(
-                            address=pool_address,
-                            topics=[
-                                self.w3.keccak(text="Mint(address,uint256,uint256)").hex()
-                            ],
-                            fromBlock=from_block,
-                            toBlock="latest"
-                        )
-                        
-                        for event in mint_events:
-                            await self._handle_mint_event(pool_address, event)
-                        
-                        # Swap events
-                        swap_events = await self.client.get_logs(
-                            address=pool_address,
-                            topics=[
-                                self.w3.keccak(text="Swap(address,address,uint256,uint256,uint256,uint256)").hex()
-                            ],
-                            fromBlock=from_block,
-                            toBlock="latest"
-                        )
-                        
-                        for event in swap_events:
-                            await self._handle_swap_event(pool_address, event)
-                    
-                    except Exception as e:
-                        logger.warning("pool_monitor_error", pool=pool_address, error=str(e))
+                # The cursor only moves once every batch succeeded, so failures are retried next poll;
+                # pools added meanwhile were not part of this poll, so their range is read again too
+                if (
+                    from_block <= to_block
+                    and await self._process_pool_logs(from_block, to_block)
+                    and len(self._pool_addresses) == pool_count
+                ):
+                    self._cursor["pools"] = to_block
                 
                 await asyncio.sleep(30)
                 
@@ -246,10 +330,167 @@ class UniswapMonitor:
                 logger.error("existing_pools_monitor_error", error=str(e))
                 await asyncio.sleep(60)
     
+    def _poll_range(self, name: str, latest_block: int, lookback: int) -> Tuple[int, int]:
+        """Get the block range of the next poll for a cursor.
+
+        Resumes a few blocks before the cursor, since an empty answer may have
+        come from an endpoint that was behind; duplicate logs are dropped by
+        ``_is_new_log``. The range is capped so a backlog is worked off in chunks.
+        """
+        cursor = self._cursor[name]
+        from_block = max(cursor + 1 - POLL_OVERLAP_BLOCKS, 0) if cursor else latest_block - lookback
+        return from_block, min(latest_block, from_block + MAX_POLL_BLOCKS - 1)
+    
+    async def _handle_new_head(self, head: Dict[str, any]) -> None:
+        """Fetch pool logs for a new block unless its logsBloom rules them out.
+
+        Blocks stay pending until a read succeeds once they are a few blocks
+        deep: the HTTP endpoint serving get_logs may not have the pushed head
+        yet, and a failed batch is retried on the next head.
+        """
+        head_number = head["number"]
+        # Heads skipped while the subscription was down were never bloom-checked, so all are read
+        if self._last_head and head_number > self._last_head + 1:
+            self._pending_blocks.update(range(self._last_head + 1, head_number))
+        self._last_head = max(self._last_head, head_number)
+        
+        if self._block_may_have_pool_events(HexBytes(head["logsBloom"])):
+            self._pending_blocks.add(head_number)
+        
+        if not self._pending_blocks:
+            return
+        
+        pending = set(self._pending_blocks)
+        from_block = min(pending)
+        to_block = min(head_number, from_block + MAX_POLL_BLOCKS - 1)
+        pool_count = len(self._pool_addresses)
+        
+        # Pools added meanwhile were not part of this read, so nothing is settled then
+        if await self._process_pool_logs(from_block, to_block) and len(self._pool_addresses) == pool_count:
+            self._pending_blocks -= {
+                block for block in pending
+                if block <= to_block and block <= head_number - POLL_OVERLAP_BLOCKS
+            }
+    
+    def _block_may_have_pool_events(self, block_bloom: bytes) -> bool:
+        """Check a block's logsBloom for Mint/Swap logs from any monitored pool.
+
+        Bloom filters have false positives but no false negatives, so a
+        False result means the block can be skipped without a get_logs call.
+        """
+        bloom = int.from_bytes(block_bloom, "big")
+        if (bloom & MINT_BLOOM_MASK) != MINT_BLOOM_MASK and (bloom & SWAP_BLOOM_MASK) != SWAP_BLOOM_MASK:
+            return False
+        
+        return any((bloom & mask) == mask for mask in self._pool_blooms)
+    
+    def _add_pool(self, pool_address: str, created_block: Optional[int] = None) -> None:
+        """Start monitoring a pool, reading its logs from the block it was created in."""
+        address = bytes(HexBytes(pool_address))
+        if address in self.monitored_pools:
+            return
+        
+        # The pool's first Mint usually lands in its creation block, which the poll or new heads may have passed
+        if created_block is not None:
+            if not self._cursor["pools"] or created_block <= self._cursor["pools"]:
+                self._cursor["pools"] = created_block - 1
+            if self.client is not None and self.client.ws_url:
+                self._pending_blocks.add(created_block)
+        
+        self.monitored_pools.add(address)
+        self._pool_addresses.append("0x" + address.hex())
+        self._pool_blooms.append(bloom_mask(address))
+    
+    async def _process_pool_logs(self, from_block: int, to_block: int) -> bool:
+        """Fetch and handle Mint and Swap logs of all monitored pools in a block range.
+
+        Returns False if any batch could not be fetched.
+        """
+        # Each request covers Mint and Swap events for a batch of pools; batches run concurrently
+        pools = self._pool_addresses
+        batch_size = self.settings.log_batch_size
+        batches = [pools[i:i + batch_size] for i in range(0, len(pools), batch_size)]
+        results = await asyncio.gather(
+            *[self._poll_pools(batch, from_block, to_block) for batch in batches],
+            return_exceptions=True,
+        )
+        
+        # Logs are routed by address; a failed batch does not hold back the others
+        complete = True
+        for batch, events in zip(batches, results):
+            if isinstance(events, Exception):
+                logger.warning("pool_batch_error", pools=len(batch), error=str(events))
+                complete = False
+                continue
+            
+            for event in events:
+                handler = self._pool_handlers.get(event["topics"][0])
+                if handler is not None and self._is_new_log(event):
+                    await handler(event["address"], event)
+        
+        return complete
+    
+    def _is_new_log(self, event: Dict[str, any]) -> bool:
+        """Record a log and tell whether it was not handled before.
+
+        Overlapping polls and subscriptions can deliver the same log twice.
+        """
+        key = event["transactionHash"] + event["logIndex"].to_bytes(4, "big")
+        if key in self._seen_logs:
+            self._seen_logs.move_to_end(key)
+            return False
+        
+        self._seen_logs[key] = None
+        if len(self._seen_logs) > SEEN_LOGS_CACHE_SIZE:
+            self._seen_logs.popitem(last=False)
+        return True
+    
+    async def _poll_pools(self, addresses: List[str], from_block: int, to_block: int) -> List[Dict[str, any]]:
+        """Fetch Mint and Swap logs for a batch of pools."""
+        async with self._rpc_semaphore:
+            return await self.client.get_logs(
+                address=addresses,
+                topics=POOL_TOPICS,
+                fromBlock=from_block,
+                toBlock=to_block
+            )
+    
+    async def _get_block_time(self, block_number: int) -> Optional[datetime]:
+        """Get block time, fetching each block header at most once.
+
+        Best effort: returns None if the header cannot be fetched, so the
+        event is still delivered without a timestamp.
+        """
+        timestamp = self._block_ts_cache.get(block_number)
+        if timestamp is None:
+            try:
+                block = await self.client.get_block(block_number)
+            except Exception as e:
+                logger.warning("block_time_unavailable", block=block_number, error=str(e))
+                return None
+            timestamp = block["timestamp"]
+            if len(self._block_ts_cache) >= BLOCK_TS_CACHE_SIZE:
+                del self._block_ts_cache[next(iter(self._block_ts_cache))]
+            self._block_ts_cache[block_number] = timestamp
+        
+        return datetime.fromtimestamp(timestamp)
+    
+    async def _handle_factory_event(self, event: Dict[str, any]) -> None:
+        """Route a factory log to its handler by topic0."""
+        handler = self._factory_handlers.get(event["topics"][0])
+        if handler is not None and self._is_new_log(event):
+            await handler(event)
+    
+    async def _handle_pushed_factory_event(self, event: Dict[str, any]) -> None:
+        """Handle a factory log pushed by the node, recording how far the subscription got."""
+        await self._handle_factory_event(event)
+        self._cursor["factories"] = max(self._cursor["factories"], event["blockNumber"])
+    
     async def _handle_v2_pair_created(self, event: Dict[str, any]) -> None:
         """Handle V2 PairCreated event."""
         try:
-            decoded = self.v2_factory.events.PairCreated().process_log(event)
+            decoded = self._pair_created_event.process_log(event)
+            self._add_pool(decoded.args.pair, decoded.blockNumber)
             
             pool_event = PoolEvent(
                 event_type="v2_pair_created",
@@ -259,9 +500,9 @@ class UniswapMonitor:
                 data={"all_pairs_length": decoded.args.allPairsLength},
                 block_number=decoded.blockNumber,
                 transaction_hash=decoded.transactionHash.hex(),
+                timestamp=await self._get_block_time(decoded.blockNumber),
             )
             
-            self.monitored_pools.add(decoded.args.pair)
             await self.on_event(pool_event)
             
             logger.info(
@@ -277,7 +518,8 @@ class UniswapMonitor:
     async def _handle_v3_pool_created(self, event: Dict[str, any]) -> None:
         """Handle V3 PoolCreated event."""
         try:
-            decoded = self.v3_factory.events.PoolCreated().process_log(event)
+            decoded = self._pool_created_event.process_log(event)
+            self._add_pool(decoded.args.pool, decoded.blockNumber)
             
             pool_event = PoolEvent(
                 event_type="v3_pool_created",
@@ -287,9 +529,9 @@ class UniswapMonitor:
                 data={"fee": decoded.args.fee, "tickSpacing": decoded.args.tickSpacing},
                 block_number=decoded.blockNumber,
                 transaction_hash=decoded.transactionHash.hex(),
+                timestamp=await self._get_block_time(decoded.blockNumber),
             )
             
-            self.monitored_pools.add(decoded.args.pool)
             await self.on_event(pool_event)
             
             logger.info(
@@ -306,29 +548,31 @@ class UniswapMonitor:
     async def _handle_mint_event(self, pool_address: str, event: Dict[str, any]) -> None:
         """Handle Mint event (liquidity addition)."""
         try:
-            # Create pair contract to decode event
-            pair_contract = self.w3.eth.contract(address=pool_address, abi=UNISWAP_V2_PAIR_ABI)
-            decoded = pair_contract.events.Mint().process_log(event)
-            
-            # Calculate approximate USD value (simplified)
-            amount0 = float(decoded.args.amount0)
-            amount1 = float(decoded.args.amount1)
-            estimated_usd = (amount0 + amount1) / 1e18  # Rough estimate
+            # Fixed layout: sender is topic1, amount0/amount1 are the two uint256 data words
+            data = HexBytes(event["data"])
+            raw_amount0 = int.from_bytes(data[0:32], "big")
+            raw_amount1 = int.from_bytes(data[32:64], "big")
             
-            if estimated_usd >= self.settings.min_liquidity_usd:
+            # Most Mints are below threshold; drop them before any further work
+            total_wei = raw_amount0 + raw_amount1
+            if total_wei >= self._min_liquidity_wei:
+                # Calculate approximate USD value (simplified); amounts stay exact integers
+                estimated_usd = total_wei / 1e18  # Rough estimate
+                
                 pool_event = PoolEvent(
                     event_type="liquidity_spike",
                     pool_address=pool_address,
                     token0="",
                     token1="",  # Will be filled by caller
                     data={
-                        "amount0": amount0,
-                        "amount1": amount1,
+                        "amount0": raw_amount0,
+                        "amount1": raw_amount1,
                         "estimated_usd": estimated_usd,
-                        "sender": decoded.args.sender,
+                        "sender": checksum_address(event["topics"][1][-20:]),
                     },
-                    block_number=decoded.blockNumber,
-                    transaction_hash=decoded.transactionHash.hex(),
+                    block_number=event["blockNumber"],
+                    transaction_hash=event["transactionHash"].hex(),
+                    timestamp=await self._get_block_time(event["blockNumber"]),
                 )
                 
                 await self.on_event(pool_event)
@@ -345,36 +589,37 @@ class UniswapMonitor:
     async def _handle_swap_event(self, pool_address: str, event: Dict[str, any]) -> None:
         """Handle Swap event."""
         try:
-            pair_contract = self.w3.eth.contract(address=pool_address, abi=UNISWAP_V2_PAIR_ABI)
-            decoded = pair_contract.events.Swap().process_log(event)
-            
-            # Calculate swap value
-            amount0_in = float(decoded.args.amount0In)
-            amount1_in = float(decoded.args.amount1In)
-            amount0_out = float(decoded.args.amount0Out)
-            amount1_out = float(decoded.args.amount1Out)
+            # Fixed layout: sender and recipient are topics 1-2,
+            # amount0In/amount1In/amount0Out/amount1Out are the four uint256 data words
+            data = HexBytes(event["data"])
+            raw_amount0_in = int.from_bytes(data[0:32], "big")
+            raw_amount1_in = int.from_bytes(data[32:64], "big")
+            raw_amount0_out = int.from_bytes(data[64:96], "big")
+            raw_amount1_out = int.from_bytes(data[96:128], "big")
             
-            total_in = (amount0_in + amount1_in) / 1e18
-            total_out = (amount0_out + amount1_out) / 1e18
-            swap_value = max(total_in, total_out)
-            
-            if swap_value >= self.settings.whale_threshold_usd:
+            # Most Swaps are below threshold; drop them before any further work
+            raw_value = max(raw_amount0_in + raw_amount1_in, raw_amount0_out + raw_amount1_out)
+            if raw_value >= self._whale_threshold_wei:
+                # Calculate swap value; amounts stay exact integers
+                swap_value = raw_value / 1e18
+                
                 pool_event = PoolEvent(
                     event_type="whale_buy",
                     pool_address=pool_address,
                     token0="",
                     token1="",  # Will be filled by caller
                     data={
-                        "amount0_in": amount0_in,
-                        "amount1_in": amount1_in,
-                        "amount0_out": amount0_out,
-                        "amount1_out": amount1_out,
+                        "amount0_in": raw_amount0_in,
+                        "amount1_in": raw_amount1_in,
+                        "amount0_out": raw_amount0_out,
+                        "amount1_out": raw_amount1_out,
                         "swap_value_usd": swap_value,
-                        "sender": decoded.args.sender,
-                        "recipient": decoded.args.recipient,
+                        "sender": checksum_address(event["topics"][1][-20:]),
+                        "recipient": checksum_address(event["topics"][2][-20:]),
                     },
-                    block_number=decoded.blockNumber,
-                    transaction_hash=decoded.transactionHash.hex(),
+                    block_number=event["blockNumber"],
+                    transaction_hash=event["transactionHash"].hex(),
+                    timestamp=await self._get_block_time(event["blockNumber"]),
                 )
                 
                 await self.on_event(pool_event)
@@ -0,0 +1,3 @@
+"""Constants shared by test modules."""
+
+TEST_POOL_ADDRESS = "0x123456789012345678901234567890"
\ No newline at end of file
@@ -90,22 +90,27 @@ async def test_status_command_error(mock_update, mock_context):
 
 
 @pytest.mark.asyncio
-async def test_pools_command_no_pools(mock_update, mock_context):
-    """Test /pools command with no pools."""
+@pytest.mark.parametrize("command,strategy_method,result,reply", [
+    (
+        pools,
+        "get_pool_stats",
+        {'monitored_pools': 0, 'active_pools_last_hour': 0, 'signal_breakdown': {}},
+        "🏊 No pools being monitored yet",
+    ),
+    (signals, "get_recent_signals", [], "📡 No recent signals"),
+])
+async def test_command_empty_state(mock_update, mock_context, command, strategy_method, result, reply):
+    """Test /pools and /signals commands with nothing to report."""
     mock_update.message.reply_text = AsyncMock()
     
     with patch('snip727.bot.main.get_strategy') as mock_get_strategy:
         mock_strategy = Mock()
-        mock_strategy.get_pool_stats.return_value = {
-            'monitored_pools': 0,
-            'active_pools_last_hour': 0,
-            'signal_breakdown': {}
-        }
+        getattr(mock_strategy, strategy_method).return_value = result
         mock_get_strategy.return_value = mock_strategy
         
-        await pools(mock_update, mock_context)
+        await command(mock_update, mock_context)
         
-        mock_update.message.reply_text.assert_called_once_with("🏊 No pools being monitored yet")
+        mock_update.message.reply_text.assert_called_once_with(reply)
 
 
 @pytest.mark.asyncio
@@ -132,21 +137,6 @@ async def test_pools_command_with_pools(mock_update, mock_context):
         assert "liquidity_spike: 4" in call_args
 
 
-@pytest.mark.asyncio
-async def test_signals_command_no_signals(mock_update, mock_context):
-    """Test /signals command with no signals."""
-    mock_update.message.reply_text = AsyncMock()
-    
-    with patch('snip727.bot.main.get_strategy') as mock_get_strategy:
-        mock_strategy = Mock()
-        mock_strategy.get_recent_signals.return_value = []
-        mock_get_strategy.return_value = mock_strategy
-        
-        await signals(mock_update, mock_context)
-        
-        mock_update.message.reply_text.assert_called_once_with("📡 No recent signals")
-
-
 @pytest.mark.asyncio
 async def test_signals_command_with_signals(mock_update, mock_context):
     """Test /signals command with signals."""
@@ -0,0 +1,34 @@
+"""Tests for application configuration."""
+import pytest
+
+from snip727.core.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings(monkeypatch, tmp_path):
+    """Re-read settings for each test, away from any local .env file."""
+    monkeypatch.chdir(tmp_path)
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.mark.parametrize("env,attr,expected", [
+    ({}, "chain_id", 1),
+    ({}, "min_liquidity_usd", 10000.0),
+    ({"CHAIN_ID": "5"}, "chain_id", 5),
+    ({"WHALE_THRESHOLD_USD": "75000"}, "whale_threshold_usd", 75000.0),
+    ({"LOG_BATCH_SIZE": "100"}, "log_batch_size", 100),
+])
+def test_settings_from_env(monkeypatch, env, attr, expected):
+    """Test settings pick up environment overrides."""
+    monkeypatch.delenv(attr.upper(), raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    
+    assert getattr(get_settings(), attr) == expected
+
+
+def test_get_settings_cached():
+    """Test settings are parsed once and shared."""
+    assert get_settings() is get_settings()
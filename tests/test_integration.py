@@ -1,12 +1,26 @@
 """Integration tests for the complete system."""
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
+from helpers import TEST_POOL_ADDRESS
+from snip727.bot.main import start, status, pools, signals, stats
+from snip727.core.config import get_settings
+from snip727.db.models import Pool, TradeEvent, SentimentScore, Signal, AlertLog
 from snip727.services.strategy import get_strategy
 from snip727.services.sentiment import get_sentiment_analyzer
-from snip727.web3.monitor import PoolEvent
+from snip727.web3.client import AsyncWeb3Client, get_web3_client
+from snip727.web3.monitor import UniswapMonitor, PoolEvent, checksum_address
 
 
+def _done(value):
+    """Create an already-resolved future, a cheap stand-in for a trivial awaitable."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_full_signal_pipeline():
     """Test complete signal generation pipeline."""
@@ -27,7 +41,7 @@ async def test_full_signal_pipeline():
         alert_callback = AsyncMock()
         strategy.add_alert_callback(alert_callback)
         
-        pool_address = "0x123456789012345678901234567890"
+        pool_address = TEST_POOL_ADDRESS
         
         # Create 3 liquidity spike events (should trigger alert)
         for i in range(3):
@@ -55,22 +69,16 @@ async def test_full_signal_pipeline():
 
 
 @pytest.mark.asyncio
-async def test_sentiment_analyzer_initialization():
+async def test_sentiment_analyzer_initialization(hf_classes):
     """Test sentiment analyzer can be initialized."""
     analyzer = get_sentiment_analyzer()
+    mock_tokenizer, mock_model = hf_classes
     
     # Should be able to call without error (mocked)
-    with patch('snip727.services.sentiment.AutoTokenizer') as mock_tokenizer, \
-         patch('snip727.services.sentiment.AutoModelForSequenceClassification') as mock_model:
-        
-        mock_tokenizer.from_pretrained.return_value = Mock()
-        mock_model.from_pretrained.return_value = Mock()
-        
-        # Test initialization
-        analyzer._initialize_model()
-        assert analyzer._initialized
-        mock_tokenizer.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
-        mock_model.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
+    analyzer._initialize_model()
+    assert analyzer._initialized
+    mock_tokenizer.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
+    mock_model.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
 
 
 @pytest.mark.asyncio
@@ -82,36 +90,75 @@ async def test_web3_client_creation():
         
         # Mock Redis
         mock_redis.from_url.return_value = Mock()
-        mock_redis.from_url.return_value.ping = AsyncMock()
+        mock_redis.from_url.return_value.ping = Mock(side_effect=lambda: _done(True))
         
         # Mock Web3
         mock_w3_instance = Mock()
-        mock_w3_instance.eth.chain_id = AsyncMock(return_value=1)
+        mock_w3_instance.eth.chain_id = _done(1)  # Awaited as a property
         mock_web3.return_value = mock_w3_instance
         
         # Mock aiohttp
         mock_session = Mock()
         mock_aiohttp.ClientSession.return_value = mock_session
         
-        from snip727.web3.client import AsyncWeb3Client
-        
         client = AsyncWeb3Client()
         await client.initialize()
         
         assert client.redis_client is not None
         assert client.w3 is not None
+        
+        # Sessions borrow the client's connector instead of owning one each
+        assert mock_aiohttp.ClientSession.call_args.kwargs["connector_owner"] is False
+
+
+@pytest.mark.asyncio
+async def test_web3_client_reconnect_same_url():
+    """Test the provider keeps using the client's session after failing over to a URL used before."""
+    with patch('snip727.web3.client.redis') as mock_redis, \
+         patch('snip727.web3.client.Web3') as mock_web3, \
+         patch('snip727.web3.client.aiohttp') as mock_aiohttp:
+        
+        mock_redis.from_url.return_value = Mock()
+        mock_redis.from_url.return_value.ping = Mock(side_effect=lambda: _done(True))
+        mock_web3.return_value.eth.chain_id = _done(1)
+        mock_aiohttp.ClientSession.side_effect = lambda **kwargs: Mock(close=AsyncMock())
+        
+        client = AsyncWeb3Client()
+        client.rpc_urls = ["https://rpc.example"]
+        await client.initialize()
+        first_session = client.session
+        
+        mock_web3.return_value.eth.chain_id = _done(1)
+        await client._try_failover(client._generation)
+        
+        provider = mock_web3.call_args.args[0]
+        assert provider.endpoint_uri == "https://rpc.example"
+        assert provider.session is client.session
+        assert client.session is not first_session
+        assert mock_aiohttp.ClientSession.call_args.kwargs["raise_for_status"] is True
+
+
+@pytest.mark.parametrize("expected", [
+    "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",  # Uniswap V2 router
+    "0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f",  # Uniswap V2 factory
+    "0x1F98431c8aD98523631AE4a59f267346ea31F984",  # Uniswap V3 factory
+])
+def test_checksum_address_cached(expected):
+    """Test raw addresses are checksummed once and then served from cache."""
+    raw = bytes.fromhex(expected[2:])
+    
+    assert checksum_address(raw) == expected
+    hits = checksum_address.cache_info().hits
+    assert checksum_address(raw) == expected
+    assert checksum_address.cache_info().hits == hits + 1
 
 
 def test_imports():
     """Test all imports work correctly."""
-    # These should not raise ImportError
-    from snip727.core.config import get_settings
-    from snip727.db.models import Pool, TradeEvent, SentimentScore, Signal, AlertLog
-    from snip727.services.sentiment import get_sentiment_analyzer
-    from snip727.services.strategy import get_strategy
-    from snip727.web3.client import get_web3_client
-    from snip727.web3.monitor import UniswapMonitor, PoolEvent
-    from snip727.bot.main import start, status, pools, signals, stats
+    # Imported at module scope; an ImportError fails collection
+    assert all((Pool, TradeEvent, SentimentScore, Signal, AlertLog))
+    assert all((get_web3_client, UniswapMonitor))
+    assert all((start, status, pools, signals, stats))
     
     # Test settings can be loaded
     settings = get_settings()
@@ -0,0 +1,236 @@
+"""Tests for the Uniswap pool monitor."""
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+from hexbytes import HexBytes
+
+from snip727.web3 import monitor as monitor_module
+from snip727.web3.monitor import MINT_TOPIC0, SWAP_TOPIC0, UniswapMonitor, bloom_mask
+
+# Async tests here share the module's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Uniswap V2 USDC/WETH pair
+PAIR_ADDRESS = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+SENDER = bytes(12) + bytes.fromhex("7a250d5630B4cF539739dF2C5dAcb4c659F2488D")
+
+def _bloom(*bit_sets):
+    """Build a 256-byte logsBloom with the given bit positions set."""
+    value = 0
+    for bits in bit_sets:
+        for bit in bits:
+            value |= 1 << bit
+    return value.to_bytes(256, "big")
+
+
+def _log(tx_byte, log_index=0, **fields):
+    """Build a raw log as returned by get_logs."""
+    return {"transactionHash": HexBytes(bytes([tx_byte]) * 32), "logIndex": log_index, "blockNumber": 100, **fields}
+
+
+def _words(*values):
+    """Encode uint256 values as log data."""
+    return b"".join(value.to_bytes(32, "big") for value in values)
+
+
+@pytest.fixture
+def monitor():
+    """Provide a monitor with a mocked client and event callback."""
+    monitor = UniswapMonitor(on_event=AsyncMock())
+    monitor.client = Mock(ws_url="")
+    monitor.client.get_block = AsyncMock(return_value={"timestamp": 1_700_000_000})
+    monitor.client.get_logs = AsyncMock(return_value=[])
+    return monitor
+
+
+@pytest.fixture
+def one_poll(monitor, monkeypatch):
+    """Stop the monitor loops at their first sleep."""
+    async def stop(_):
+        monitor.running = False
+    
+    monkeypatch.setattr(asyncio, "sleep", stop)
+    monitor.running = True
+    return monitor
+
+
+# Bit positions per the yellow paper bloom: low 11 bits of keccak byte pairs 0, 2 and 4
+@pytest.mark.parametrize("value,bits", [
+    (MINT_TOPIC0, [401, 1107, 1800]),
+    (SWAP_TOPIC0, [224, 1399, 1786]),
+    (bytes(HexBytes(PAIR_ADDRESS)), [1414, 2030]),  # Two of the three bits coincide
+])
+def test_bloom_mask_bits(value, bits):
+    """Test bloom masks set the logsBloom bits of an address or topic."""
+    assert bloom_mask(value) == sum(1 << bit for bit in bits)
+
+
+@pytest.mark.parametrize("bit_sets,expected", [
+    ([[1414, 2030], [401, 1107, 1800]], True),  # Mint from the pair
+    ([[1414, 2030], [224, 1399, 1786]], True),  # Swap from the pair
+    ([[1414, 2030]], False),  # Pair logged something else
+    ([[170, 1007, 1019], [401, 1107, 1800]], False),  # Mint from another pool
+    ([], False),
+])
+def test_block_may_have_pool_events(monitor, bit_sets, expected):
+    """Test the block bloom check only passes blocks with Mint/Swap from a monitored pool."""
+    monitor._add_pool(PAIR_ADDRESS)
+    
+    assert monitor._block_may_have_pool_events(_bloom(*bit_sets)) is expected
+
+
+def test_is_new_log_dedup(monitor):
+    """Test each (transactionHash, logIndex) is handled once."""
+    assert monitor._is_new_log(_log(1, 0))
+    assert not monitor._is_new_log(_log(1, 0))
+    assert monitor._is_new_log(_log(1, 1))
+    assert monitor._is_new_log(_log(2, 0))
+
+
+def test_is_new_log_evicts_least_recent(monitor, monkeypatch):
+    """Test the dedup cache drops the least recently seen log when full."""
+    monkeypatch.setattr(monitor_module, "SEEN_LOGS_CACHE_SIZE", 2)
+    
+    monitor._is_new_log(_log(1))
+    monitor._is_new_log(_log(2))
+    assert not monitor._is_new_log(_log(1))  # Refreshes 1, so 2 is now the oldest
+    monitor._is_new_log(_log(3))
+    
+    assert monitor._is_new_log(_log(2))
+    assert not monitor._is_new_log(_log(3))
+
+
+@pytest.mark.parametrize("offset,expected_calls", [(-1, 0), (0, 1), (10**18, 1)])
+async def test_mint_threshold(monitor, offset, expected_calls):
+    """Test Mints are reported only when the raw amounts reach the liquidity threshold."""
+    amount0 = monitor._min_liquidity_wei // 2
+    amount1 = monitor._min_liquidity_wei - amount0 + offset
+    event = _log(1, topics=[MINT_TOPIC0, SENDER], data=_words(amount0, amount1))
+    
+    await monitor._handle_mint_event(PAIR_ADDRESS, event)
+    
+    assert monitor.on_event.call_count == expected_calls
+    if expected_calls:
+        pool_event = monitor.on_event.call_args[0][0]
+        assert pool_event.event_type == "liquidity_spike"
+        assert pool_event.data["amount0"] == amount0
+        assert pool_event.data["amount1"] == amount1
+        assert pool_event.data["sender"] == "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+
+
+@pytest.mark.parametrize("amounts_in,amounts_out,parts,offset,expected_calls", [
+    ((1, 0), (0, 1), 1, -1, 0),
+    ((1, 0), (0, 1), 1, 0, 1),  # Buy of token1
+    ((0, 1), (1, 0), 1, 0, 1),  # Buy of token0
+    ((1, 1), (0, 0), 2, -1, 0),
+    ((1, 1), (0, 0), 2, 0, 1),  # Both inputs count
+])
+async def test_swap_threshold(monitor, amounts_in, amounts_out, parts, offset, expected_calls):
+    """Test Swaps are reported only when the larger side reaches the whale threshold."""
+    value = monitor._whale_threshold_wei // parts + offset
+    amounts = [side * value for side in amounts_in + amounts_out]
+    event = _log(1, topics=[SWAP_TOPIC0, SENDER, SENDER], data=_words(*amounts))
+    
+    await monitor._handle_swap_event(PAIR_ADDRESS, event)
+    
+    assert monitor.on_event.call_count == expected_calls
+    if expected_calls:
+        pool_event = monitor.on_event.call_args[0][0]
+        assert pool_event.event_type == "whale_buy"
+        assert [pool_event.data[key] for key in ("amount0_in", "amount1_in", "amount0_out", "amount1_out")] == amounts
+
+
+async def test_event_without_block_time(monitor):
+    """Test events are still reported when the block header cannot be fetched."""
+    monitor.client.get_block = AsyncMock(side_effect=Exception("rate limited"))
+    event = _log(1, topics=[MINT_TOPIC0, SENDER], data=_words(monitor._min_liquidity_wei, 0))
+    
+    await monitor._handle_mint_event(PAIR_ADDRESS, event)
+    
+    assert monitor.on_event.call_args[0][0].timestamp is None
+
+
+@pytest.mark.parametrize("latest,get_logs_error,expected_range,expected_cursor", [
+    (1010, None, (996, 1010), 1010),  # Re-reads 5 blocks of overlap
+    (1010, Exception("rate limited"), (996, 1010), 1000),  # Retried next poll
+    (5000, None, (996, 1495), 1495),  # Capped at 500 blocks
+])
+async def test_pools_cursor(one_poll, latest, get_logs_error, expected_range, expected_cursor):
+    """Test the pools cursor only advances over ranges that were read completely."""
+    monitor = one_poll
+    monitor._add_pool(PAIR_ADDRESS)
+    monitor._cursor["pools"] = 1000
+    monitor.client.get_block_number = AsyncMock(return_value=latest)
+    monitor.client.get_logs = AsyncMock(return_value=[], side_effect=get_logs_error)
+    
+    await monitor._monitor_existing_pools()
+    
+    kwargs = monitor.client.get_logs.call_args.kwargs
+    assert (kwargs["fromBlock"], kwargs["toBlock"]) == expected_range
+    assert monitor._cursor["pools"] == expected_cursor
+
+
+def test_new_pool_rewinds_cursor(monitor):
+    """Test a pool created behind the pools cursor is read from its creation block."""
+    monitor._cursor["pools"] = 1000
+    
+    monitor._add_pool(PAIR_ADDRESS, created_block=990)
+    
+    assert monitor._cursor["pools"] == 989
+
+
+async def test_new_head_retries_pending_blocks(monitor):
+    """Test subscription mode re-reads a new pool's blocks until they are settled."""
+    monitor.client.ws_url = "wss://node"
+    monitor._add_pool(PAIR_ADDRESS, created_block=100)
+    monitor.client.get_logs = AsyncMock(side_effect=Exception("rate limited"))
+    
+    await monitor._handle_new_head({"number": 101, "logsBloom": bytes(256)})
+    assert monitor._pending_blocks == {100}
+    
+    monitor.client.get_logs = AsyncMock(return_value=[])
+    await monitor._handle_new_head({"number": 102, "logsBloom": bytes(256)})
+    assert monitor.client.get_logs.call_args.kwargs["fromBlock"] == 100
+    assert monitor._pending_blocks == {100}  # Not yet deep enough
+    
+    await monitor._handle_new_head({"number": 105, "logsBloom": bytes(256)})
+    assert monitor._pending_blocks == set()
+
+async def test_new_heads_gap_is_backfilled(monitor, monkeypatch):
+    """Test heads missed while the subscription was down are read after resubscribing."""
+    async def no_sleep(_):
+        pass
+    
+    async def subscribe(subscription_type, params, on_subscribed=None):
+        connections.append(subscription_type)
+        if len(connections) == 1:
+            yield {"number": 100, "logsBloom": bytes(256)}
+            raise ConnectionError("socket closed")
+        yield {"number": 104, "logsBloom": bytes(256)}
+        monitor.running = False
+    
+    connections = []
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    monitor.client.ws_url = "wss://node"
+    monitor.client.subscribe = subscribe
+    monitor._add_pool(PAIR_ADDRESS)
+    monitor.running = True
+    
+    await monitor._subscribe("new_heads", "newHeads", None, monitor._handle_new_head)
+    
+    assert connections == ["newHeads", "newHeads"]
+    kwargs = monitor.client.get_logs.call_args.kwargs
+    assert (kwargs["fromBlock"], kwargs["toBlock"]) == (101, 104)
+    assert monitor._pending_blocks == {101, 102, 103}  # Re-read until deep enough
+
+
+async def test_factory_resubscribe_catches_up(monitor):
+    """Test factory logs missed while the subscription was down are read over HTTP."""
+    monitor._cursor["factories"] = 1000
+    monitor.client.get_block_number = AsyncMock(return_value=1600)
+    
+    await monitor._catch_up_factories()
+    
+    ranges = [(c.kwargs["fromBlock"], c.kwargs["toBlock"]) for c in monitor.client.get_logs.call_args_list]
+    assert ranges == [(996, 1495), (1491, 1600)]
+    assert monitor._cursor["factories"] == 1600
\ No newline at end of file
@@ -1,64 +1,74 @@
 """Tests for sentiment analysis."""
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 from snip727.services.sentiment import SentimentAnalyzer
 
+# Every test here is async and shares the module's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def sentiment_analyzer():
-    """Create sentiment analyzer instance."""
-    return SentimentAnalyzer()
 
-
-@pytest.mark.asyncio
-async def test_sentiment_analyzer_initialization(sentiment_analyzer):
+async def test_sentiment_analyzer_initialization(sentiment_analyzer, hf_classes):
     """Test sentiment analyzer initialization."""
+    mock_tokenizer, mock_model = hf_classes
+    
     # Should not be initialized initially
     assert not sentiment_analyzer._initialized
     
-    # Mock model loading
-    with patch('snip727.services.sentiment.AutoTokenizer') as mock_tokenizer, \
-         patch('snip727.services.sentiment.AutoModelForSequenceClassification') as mock_model:
-        
-        mock_tokenizer.from_pretrained.return_value = Mock()
-        mock_model.from_pretrained.return_value = Mock()
-        
-        # Initialize
-        sentiment_analyzer._initialize_model()
-        
-        # Should be initialized
-        assert sentiment_analyzer._initialized
-        mock_tokenizer.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
-        mock_model.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
+    # Initialize
+    sentiment_analyzer._initialize_model()
+    
+    # Should be initialized
+    assert sentiment_analyzer._initialized
+    mock_tokenizer.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
+    mock_model.from_pretrained.assert_called_once_with("cointegrated/rubert-base-cased-sentence-sentiment")
 
 
-@pytest.mark.asyncio
-async def test_analyze_sentiment_empty_text(sentiment_analyzer):
+@pytest.mark.parametrize("text", ["", "   ", "\n\t"])
+async def test_analyze_sentiment_empty_text(sentiment_analyzer, text):
     """Test sentiment analysis with empty text."""
-    result = await sentiment_analyzer.analyze_sentiment("")
+    result = await sentiment_analyzer.analyze_sentiment(text)
     assert result == 0
+
+
+@pytest.fixture(scope="module")
+def mocked_analyzer():
+    """Create one analyzer with inference mocked out, shared by the module."""
+    analyzer = SentimentAnalyzer()
+    analyzer._initialized = True  # Skip model loading
     
-    result = await sentiment_analyzer.analyze_sentiment("   ")
-    assert result == 0
+    with patch.object(analyzer, '_analyze_sync') as mock_analyze:
+        yield analyzer, mock_analyze
 
 
-@pytest.mark.asyncio
-async def test_analyze_sentiment_mocked(sentiment_analyzer):
+@pytest.mark.parametrize("text,expected", [
+    ("Great token!", 1),  # Positive sentiment
+    ("Rug pull incoming", -1),  # Negative sentiment
+    ("New pool created", 0),  # Neutral sentiment
+])
+async def test_analyze_sentiment_mocked(mocked_analyzer, text, expected):
     """Test sentiment analysis with mocked model."""
-    # Mock the model and tokenizer
-    with patch.object(sentiment_analyzer, '_initialize_model'), \
-         patch.object(sentiment_analyzer, '_analyze_sync') as mock_analyze:
-        
-        mock_analyze.return_value = 1  # Positive sentiment
-        
-        result = await sentiment_analyzer.analyze_sentiment("Great token!")
-        
-        assert result == 1
-        mock_analyze.assert_called_once_with("Great token!")
+    analyzer, mock_analyze = mocked_analyzer
+    mock_analyze.reset_mock()
+    mock_analyze.return_value = expected
+    
+    result = await analyzer.analyze_sentiment(text)
+    
+    assert result == expected
+    mock_analyze.assert_called_once_with(text)
+
+
+async def test_analyze_sentiment_batch(sentiment_analyzer):
+    """Test batch sentiment analysis keeps input order and skips blank texts."""
+    sentiment_analyzer._initialized = True  # Skip model loading
+    
+    with patch.object(sentiment_analyzer, '_analyze_batch_sync', return_value=[1, -1]) as mock_batch:
+        result = await sentiment_analyzer.analyze_sentiment_batch(["Great token!", "", "Rug pull"])
+    
+    assert result == [1, 0, -1]
+    mock_batch.assert_called_once_with(["Great token!", "Rug pull"])
 
 
-@pytest.mark.asyncio
 async def test_analyze_crypto_sentiment_no_events(sentiment_analyzer):
     """Test crypto sentiment analysis with no events."""
     result = await sentiment_analyzer.analyze_crypto_sentiment("BTC", [])
@@ -73,7 +83,6 @@ async def test_analyze_crypto_sentiment_no_events(sentiment_analyzer):
     assert result == expected
 
 
-@pytest.mark.asyncio
 async def test_analyze_crypto_sentiment_with_events(sentiment_analyzer):
     """Test crypto sentiment analysis with events."""
     # Mock PoolEvent
@@ -88,12 +97,17 @@ async def test_analyze_crypto_sentiment_with_events(sentiment_analyzer):
         MockPoolEvent("whale_buy", {"swap_value_usd": 100000}),
     ]
     
-    with patch.object(sentiment_analyzer, 'analyze_sentiment') as mock_analyze:
-        # Mock different sentiments for different texts
-        mock_analyze.side_effect = [1, 1, 0]  # positive, positive, neutral
-        
+    # Mock different sentiments for different texts
+    mock_batch = AsyncMock(return_value=[1, 1, 0])  # positive, positive, neutral
+    with patch.object(sentiment_analyzer, 'analyze_sentiment_batch', mock_batch):
         result = await sentiment_analyzer.analyze_crypto_sentiment("TOKEN", events)
         
+        # All texts go to the model in a single batch
+        mock_batch.assert_called_once_with([
+            "New trading pair created for TOKEN",
+            "Major liquidity addition of $50,000 for TOKEN",
+            "Large whale purchase of $100,000 for TOKEN",
+        ])
         assert result["sentiment"] == 1  # Overall positive
         assert result["confidence"] == 2/3  # 2 out of 3 positive
         assert len(result["texts"]) == 3
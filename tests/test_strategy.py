@@ -1,30 +1,31 @@
 """Tests for N-of-4 strategy."""
 import pytest
+from collections import deque
+from dataclasses import replace
 from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 
-from snip727.services.strategy import Nof4Strategy, Signal
+from helpers import TEST_POOL_ADDRESS
+from snip727.services.strategy import MAX_SIGNAL_HISTORY, Signal
 from snip727.web3.monitor import PoolEvent
 
 
-@pytest.fixture
-def strategy():
-    """Create strategy instance."""
-    return Nof4Strategy()
+# PoolEvent is frozen, so one instance can back every test; derive variants with replace()
+BASE_POOL_EVENT = PoolEvent(
+    event_type="v2_pair_created",
+    pool_address=TEST_POOL_ADDRESS,
+    token0="0x1111111111111111111111111111111",
+    token1="0x2222222222222222222222222222222",
+    data={"all_pairs_length": 1000},
+    block_number=12345,
+    transaction_hash="0xabcdef1234567890abcdef1234567890abcdef1234567890",
+)
 
 
 @pytest.fixture
 def sample_pool_event():
-    """Create sample pool event."""
-    return PoolEvent(
-        event_type="v2_pair_created",
-        pool_address="0x123456789012345678901234567890",
-        token0="0x1111111111111111111111111111111",
-        token1="0x2222222222222222222222222222222",
-        data={"all_pairs_length": 1000},
-        block_number=12345,
-        transaction_hash="0xabcdef1234567890abcdef1234567890abcdef1234567890",
-    )
+    """Provide sample pool event."""
+    return BASE_POOL_EVENT
 
 
 @pytest.mark.asyncio
@@ -42,14 +43,12 @@ async def test_process_event_new_pool(strategy, sample_pool_event):
 @pytest.mark.asyncio
 async def test_process_event_liquidity_spike(strategy):
     """Test processing liquidity spike event."""
-    event = PoolEvent(
+    event = replace(
+        BASE_POOL_EVENT,
         event_type="liquidity_spike",
-        pool_address="0x123456789012345678901234567890",
         token0="",
         token1="",
         data={"estimated_usd": 50000},
-        block_number=12345,
-        transaction_hash="0xabcdef1234567890abcdef1234567890abcdef1234567890",
     )
     
     await strategy.process_event(event)
@@ -62,14 +61,12 @@ async def test_process_event_liquidity_spike(strategy):
 @pytest.mark.asyncio
 async def test_process_event_whale_buy(strategy):
     """Test processing whale buy event."""
-    event = PoolEvent(
+    event = replace(
+        BASE_POOL_EVENT,
         event_type="whale_buy",
-        pool_address="0x123456789012345678901234567890",
         token0="",
         token1="",
         data={"swap_value_usd": 100000},
-        block_number=12345,
-        transaction_hash="0xabcdef1234567890abcdef1234567890abcdef1234567890",
     )
     
     await strategy.process_event(event)
@@ -83,17 +80,15 @@ async def test_process_event_whale_buy(strategy):
 async def test_check_for_alerts_insufficient_signals(strategy):
     """Test alert check with insufficient signals."""
     # Add only 2 signals (less than required 3)
-    pool_address = "0x123456789012345678901234567890"
-    
-    for i in range(2):
-        signal = Signal(
-            signal_type="liquidity_spike",
-            pool_address=pool_address,
-            confidence=0.8,
-            data={},
-            timestamp=datetime.now(),
-        )
-        strategy.signals.append(signal)
+    pool_address = TEST_POOL_ADDRESS
+    signal = Signal(
+        signal_type="liquidity_spike",
+        pool_address=pool_address,
+        confidence=0.8,
+        data={},
+        timestamp=datetime.now(),
+    )
+    strategy.signals.extend([signal] * 2)
     
     # Mock callback
     callback = AsyncMock()
@@ -108,18 +103,17 @@ async def test_check_for_alerts_insufficient_signals(strategy):
 @pytest.mark.asyncio
 async def test_check_for_alerts_sufficient_signals(strategy):
     """Test alert check with sufficient signals."""
-    pool_address = "0x123456789012345678901234567890"
+    pool_address = TEST_POOL_ADDRESS
     
-    # Add 3 signals of same type
-    for i in range(3):
-        signal = Signal(
-            signal_type="liquidity_spike",
-            pool_address=pool_address,
-            confidence=0.8,
-            data={},
-            timestamp=datetime.now(),
-        )
-        strategy.signals.append(signal)
+    # Add 3 signals of same type; signals are never mutated, so one instance can repeat
+    signal = Signal(
+        signal_type="liquidity_spike",
+        pool_address=pool_address,
+        confidence=0.8,
+        data={},
+        timestamp=datetime.now(),
+    )
+    strategy.signals.extend([signal] * 3)
     
     # Mock sentiment analyzer
     with patch('snip727.services.strategy.get_sentiment_analyzer') as mock_get_analyzer:
@@ -147,7 +141,7 @@ async def test_check_for_alerts_sufficient_signals(strategy):
 
 def test_get_recent_signals(strategy):
     """Test getting recent signals."""
-    pool_address = "0x123456789012345678901234567890"
+    pool_address = TEST_POOL_ADDRESS
     
     # Add signals with different timestamps
     now = datetime.now()
@@ -179,21 +173,47 @@ def test_get_recent_signals(strategy):
     assert recent_signals[0]["type"] == "liquidity_spike"
 
 
+def test_signal_history_bounded(strategy):
+    """Test signal history is a bounded deque that drops the oldest signals."""
+    assert isinstance(strategy.signals, deque)
+    
+    old_signal = Signal(
+        signal_type="new_pool",
+        pool_address=TEST_POOL_ADDRESS,
+        confidence=0.7,
+        data={},
+        timestamp=datetime.now() - timedelta(hours=25),
+    )
+    strategy.signals.extend([old_signal] * (MAX_SIGNAL_HISTORY + 10))
+    
+    assert len(strategy.signals) == MAX_SIGNAL_HISTORY
+    assert strategy.get_recent_signals() == []
+
+
+def test_signal_and_event_have_no_instance_dict():
+    """Test Signal and PoolEvent use slots instead of a per-instance __dict__."""
+    signal = Signal("new_pool", TEST_POOL_ADDRESS, 0.7, {}, datetime.now())
+    
+    assert not hasattr(signal, "__dict__")
+    assert not hasattr(BASE_POOL_EVENT, "__dict__")
+
+
 def test_get_pool_stats(strategy):
     """Test getting pool statistics."""
-    pool_address = "0x123456789012345678901234567890"
+    pool_address = TEST_POOL_ADDRESS
     
     # Add some data
-    strategy.event_history[pool_address] = [Mock(), Mock()]  # 2 events
+    strategy.event_history[pool_address] = [0, 1]  # 2 events; only the count is read
     
     # Add signals
+    now = datetime.now()
     for signal_type in ["new_pool", "liquidity_spike", "liquidity_spike"]:
         signal = Signal(
             signal_type=signal_type,
             pool_address=pool_address,
             confidence=0.8,
             data={},
-            timestamp=datetime.now(),
+            timestamp=now,
         )
         strategy.signals.append(signal)
     